@@ -4,55 +4,207 @@ import os
 import sys
 import argparse
 from datetime import datetime, timedelta
+import asyncio
 import json
+import sqlite3
 import time
 import re
+import threading
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 from colorama import init, Fore, Style
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import lxml.html
+
+# orjson serializes/parses several times faster than json; fall back if missing ####
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ciso8601 parses ISO timestamps in C; datetime.fromisoformat is the fallback ####
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
+
+# Respect pipes/CI and NO_COLOR: bypass colorama's translation when stdout isn't a terminal ####
+USE_COLOR = sys.stdout.isatty() and os.environ.get('NO_COLOR') is None
+if USE_COLOR:
+    init(autoreset=True)
+else:
+    Fore = type('F', (), {k: '' for k in ('RED', 'GREEN', 'BLUE', 'YELLOW', 'CYAN', 'WHITE', 'RESET')})()
+
+# Static message tags, built once instead of per print call ####
+_TAG_INFO = f"{Fore.BLUE}[*] Info{Fore.RESET}"
+_TAG_ERR = f"{Fore.RED}[!] Error{Fore.RESET}"
+_TAG_OK = f"{Fore.GREEN}[+] Success{Fore.RESET}"
+
+# All date shapes in one alternation; the group that matched implies the strptime format ####
+_DATE_RE = re.compile(
+    r'(?P<mdy>\w+ \d{1,2}, \d{4})'
+    r'|(?P<dmy>\d{1,2} \w+ \d{4})'
+    r'|(?P<slash>\d{1,2}/\d{1,2}/\d{4})'
+    r'|(?P<my>\w+ \d{4})'
+)
+_DATE_FORMATS = {'mdy': '%b %d, %Y', 'dmy': '%d %b %Y', 'slash': '%m/%d/%Y', 'my': '%b %Y'}
+_DIV_DATE_RE = re.compile(r'\w+ \d{1,2}, \d{4}')
+
+# Package table: one row per tracked package, updated in place ####
+_DB_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS packages (
+    name TEXT PRIMARY KEY,
+    check_date TEXT,
+    last_update TEXT,
+    last_fetched TEXT,
+    fetch_count INT,
+    last_error TEXT,
+    etag TEXT,
+    last_modified TEXT
+)
+'''
+_DB_UPSERT = '''
+INSERT INTO packages (name, check_date, last_update, last_fetched, fetch_count, last_error, etag, last_modified)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(name) DO UPDATE SET
+    check_date=excluded.check_date, last_update=excluded.last_update, last_fetched=excluded.last_fetched,
+    fetch_count=excluded.fetch_count, last_error=excluded.last_error, etag=excluded.etag,
+    last_modified=excluded.last_modified
+'''
+
+def _db_row(package_name: str, info: Dict) -> Tuple:
+    # Flatten a package record into the column order of the packages table ####
+    return (
+        package_name, info.get('check_date', ''), info.get('last_update', ''), info.get('last_fetched', ''),
+        info.get('fetch_count', 0), info.get('last_error', ''), info.get('etag', ''), info.get('last_modified', '')
+    )
+
+# The update date sits near the top of the page; never buffer more than this ####
+_MAX_FETCH_BYTES = 512 * 1024
+
+# Cap on the in-memory fetch cache, lru_cache-style ####
+_FETCH_CACHE_SIZE = 256
+
+# Transient statuses retried with backoff (the transport's retries only cover connection failures) ####
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+
+# Per-host politeness: keep requests at least this far apart ####
+_MIN_REQUEST_INTERVAL = 1.0
+_next_request_ts: Dict[str, float] = {}
+_rate_lock = threading.Lock()
+
+@lru_cache(maxsize=1024)
+def _parse_play_store_date(date_str: str) -> Optional[datetime]:
+    # Parse a human-readable Play Store date: one scan, one strptime #####
+    match = _DATE_RE.search(date_str)
+    if match:
+        try:
+            return datetime.strptime(match.group(match.lastgroup), _DATE_FORMATS[match.lastgroup])
+        except ValueError:
+            pass
+
+    return None
+
+def _is_newer_date(current: str, previous: str) -> bool:
+    # True only when both strings parse and current is strictly later (parses are LRU-cached) ####
+    new_date = _parse_play_store_date(current.strip())
+    old_date = _parse_play_store_date(previous.strip())
+    return bool(new_date and old_date and new_date > old_date)
+
+async def _respect_rate_limit(host: str):
+    # Reserve the next request slot for the host; only sleeps if a recent request actually happened ####
+    with _rate_lock:
+        now = time.monotonic()
+        slot = max(now, _next_request_ts.get(host, 0.0))
+        _next_request_ts[host] = slot + _MIN_REQUEST_INTERVAL
+    if slot > now:
+        await asyncio.sleep(slot - now)
 
-init(autoreset=True)
 class AppUpdateChecker:
     def __init__(self):
         self.data_dir = os.path.expanduser("~/.local/share/appUpdateChecker")
+        self.db_file = os.path.join(self.data_dir, "data.db")
+        # Legacy JSON database, imported once into SQLite ####
         self.data_file = os.path.join(self.data_dir, "data.json")
         self.cache_duration = 300
+        # In-memory TTL cache: package_name -> (monotonic timestamp, (update_date, error)) ####
+        self._fetch_cache: Dict[str, Tuple[float, Tuple[Optional[str], Optional[str]]]] = {}
+        self._cache_lock = threading.Lock()
         self.ensure_data_dir()
         self.setup_session()
+        # Parse the database once per CLI invocation; all commands operate on this dict ####
+        self.data = self.load_data()
 
     def setup_session(self):
         # HTTP Connection #########################################################################################################################
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
-        })
+        }
+
+    def _make_client(self) -> httpx.AsyncClient:
+        # One HTTP/2 client per event loop: concurrent fetches multiplex over a single TLS connection #############################################
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
+        return httpx.AsyncClient(headers=self.headers, timeout=30, follow_redirects=True, transport=transport)
 
     def ensure_data_dir(self):
-        # Directory ###############################################################################################################################
+        # Directory + database ####################################################################################################################
         try:
             os.makedirs(self.data_dir, exist_ok=True)
-            if not os.path.exists(self.data_file):
-                self.save_data({})
+            fresh_db = not os.path.exists(self.db_file)
+            self.db = sqlite3.connect(self.db_file)
+            with self.db:
+                self.db.execute(_DB_SCHEMA)
+            if fresh_db:
+                self.import_legacy_json()
         except Exception as e:
             print(f"{Fore.RED}[!] Error creating directory: {e}{Fore.RESET}")
             sys.exit(1)
 
+    def import_legacy_json(self):
+        # One-shot import of the old data.json into SQLite ########################################################################################
+        if not os.path.exists(self.data_file):
+            return
+        try:
+            if orjson is not None:
+                with open(self.data_file, 'rb') as f:
+                    legacy = orjson.loads(f.read())
+            else:
+                with open(self.data_file, 'r', encoding='utf-8') as f:
+                    legacy = json.load(f)
+            self.save_data(self.migrate_data_format(legacy))
+        except (FileNotFoundError, ValueError) as e:
+            print(f"{Fore.YELLOW}[!] Warning: Error importing legacy data: {e}{Fore.RESET}")
+
     def load_data(self) -> Dict:
         # Load data ###############################################################################################################################
         try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return self.migrate_data_format(data)
-            return {}
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"{Fore.YELLOW}[!] Warning: Error loading data, creating new file: {e}{Fore.RESET}")
+            rows = self.db.execute(
+                'SELECT name, check_date, last_update, last_fetched, fetch_count, last_error, etag, last_modified FROM packages'
+            )
+            return {
+                name: {
+                    'check_date': check_date,
+                    'last_update': last_update,
+                    'last_fetched': last_fetched,
+                    'fetch_count': fetch_count,
+                    'last_error': last_error,
+                    'etag': etag,
+                    'last_modified': last_modified
+                }
+                for name, check_date, last_update, last_fetched, fetch_count, last_error, etag, last_modified in rows
+            }
+        except sqlite3.Error as e:
+            print(f"{Fore.YELLOW}[!] Warning: Error loading data: {e}{Fore.RESET}")
             return {}
 
     def migrate_data_format(self, data: Dict) -> Dict:
@@ -66,163 +218,232 @@ class AppUpdateChecker:
                     'last_update': info.get('last_update', ''),
                     'last_fetched': info.get('last_fetched', ''),
                     'fetch_count': info.get('fetch_count', 0),
-                    'last_error': info.get('last_error', '')
+                    'last_error': info.get('last_error', ''),
+                    'etag': info.get('etag', ''),
+                    'last_modified': info.get('last_modified', '')
                 }
         return migrated
 
     def save_data(self, data: Dict):
-        # Save info ###############################################################################################################################
+        # Save info (full sync, one transaction: upsert every record, drop removed ones) ##########################################################
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
+            with self.db:
+                if data:
+                    placeholders = ','.join('?' * len(data))
+                    self.db.execute(f'DELETE FROM packages WHERE name NOT IN ({placeholders})', tuple(data))
+                else:
+                    self.db.execute('DELETE FROM packages')
+                self.db.executemany(_DB_UPSERT, [_db_row(name, info) for name, info in data.items()])
+        except sqlite3.Error as e:
+            print(f"{Fore.RED}[!] Error saving data: {e}{Fore.RESET}")
+
+    def save_package(self, package_name: str, info: Dict):
+        # Persist one package row (O(1) instead of rewriting the whole database) ##################################################################
+        try:
+            with self.db:
+                self.db.execute(_DB_UPSERT, _db_row(package_name, info))
+        except sqlite3.Error as e:
             print(f"{Fore.RED}[!] Error saving data: {e}{Fore.RESET}")
 
     def parse_play_store_date(self, date_str: str) -> Optional[datetime]:
-        # Parse Play Store date ###################################################################################################################
-        # Clean the date string #####
-        date_str = date_str.strip()
-        
-        # Common date patterns ######
-        patterns = [
-            r'(\w+ \d{1,2}, \d{4})',
-            r'(\d{1,2} \w+ \d{4})',
-            r'(\w+ \d{4})',
-            r'(\d{1,2}/\d{1,2}/\d{4})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, date_str)
-            if match:
-                try:
-                    date_part = match.group(1)
-                    # Parsing formats #####
-                    formats = ['%b %d, %Y', '%d %b %Y', '%b %Y', '%m/%d/%Y']
-                    for fmt in formats:
-                        try:
-                            return datetime.strptime(date_part, fmt)
-                        except ValueError:
-                            continue
-                except Exception:
-                    continue
-        
-        return None
+        # Parse Play Store date (cached: the same strings recur on every run) #####################################################################
+        return _parse_play_store_date(date_str.strip())
+
+    def get_play_store_update_date(self, package_name: str, info: Optional[Dict] = None) -> Tuple[Optional[str], Optional[str]]:
+        # Sync entry point for one-shot fetches (add_package) #####################################################################################
+        return asyncio.run(self._get_update_date_once(package_name, info))
+
+    async def _get_update_date_once(self, package_name: str, info: Optional[Dict] = None) -> Tuple[Optional[str], Optional[str]]:
+        # Spin up a short-lived client for a single fetch #########################################################################################
+        async with self._make_client() as client:
+            return await self._get_update_date(client, package_name, info)
+
+    async def _get_update_date(self, client: httpx.AsyncClient, package_name: str, info: Optional[Dict] = None) -> Tuple[Optional[str], Optional[str]]:
+        # Get last update (memoized for cache_duration seconds) ###################################################################################
+        now = time.monotonic()
+        with self._cache_lock:
+            hit = self._fetch_cache.get(package_name)
+            if hit and now - hit[0] < self.cache_duration:
+                return hit[1]
 
-    def get_play_store_update_date(self, package_name: str) -> Tuple[Optional[str], Optional[str]]:
-        # Get last update #########################################################################################################################
+        result = await self._fetch_update_date(client, package_name, info)
+
+        with self._cache_lock:
+            self._fetch_cache[package_name] = (time.monotonic(), result)
+            # Evict the stalest entry once past the cap, like lru_cache(maxsize=256) ####
+            if len(self._fetch_cache) > _FETCH_CACHE_SIZE:
+                oldest = min(self._fetch_cache, key=lambda name: self._fetch_cache[name][0])
+                del self._fetch_cache[oldest]
+        return result
+
+    async def _fetch_update_date(self, client: httpx.AsyncClient, package_name: str, info: Optional[Dict] = None) -> Tuple[Optional[str], Optional[str]]:
+        # Fetch last update from the Play Store ###################################################################################################
         try:
             url = f"https://play.google.com/store/apps/details?id={package_name}&hl=en"
-            
-            # #Avoid rate limit ####
-            time.sleep(1)
-            
-            response = self.session.get(url, timeout=30)
-            
-            if response.status_code == 404:
-                return None, "App not found in Play Store"
-            elif response.status_code != 200:
-                return None, f"HTTP {response.status_code}"
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Types of update ####
+            # #Avoid rate limit (no-op on the first request of a run) ####
+            await _respect_rate_limit('play.google.com')
+
+            # Send cached validators so an unchanged page comes back as a ~300 B 304 ####
+            # (only when a stored date exists to serve, so a 304 can always be answered locally) ####
+            headers = {}
+            if info and info.get('last_update'):
+                if info.get('etag'):
+                    headers['If-None-Match'] = info['etag']
+                if info.get('last_modified'):
+                    headers['If-Modified-Since'] = info['last_modified']
+
+            # Retry 429/5xx with backoff, like the old urllib3 Retry(total=3, backoff_factor=0.3) ####
+            attempt = 0
+            while True:
+                async with client.stream('GET', url, headers=headers) as response:
+                    if response.status_code in _RETRY_STATUSES and attempt < _RETRY_TOTAL:
+                        attempt += 1
+                    elif response.status_code == 304 and info and info.get('last_update'):
+                        # Page unchanged since last fetch: reuse the stored date, skip parsing ####
+                        return info['last_update'], None
+                    elif response.status_code == 404:
+                        return None, "App not found in Play Store"
+                    elif response.status_code != 200:
+                        return None, f"HTTP {response.status_code}"
+                    else:
+                        if info is not None:
+                            info['etag'] = response.headers.get('ETag', '')
+                            info['last_modified'] = response.headers.get('Last-Modified', '')
+
+                        # Bounded read: stop pulling chunks once the cap is reached ####
+                        chunks = []
+                        read = 0
+                        async for chunk in response.aiter_bytes():
+                            chunks.append(chunk)
+                            read += len(chunk)
+                            if read >= _MAX_FETCH_BYTES:
+                                break
+                        content = b''.join(chunks)
+                        break
+
+                await asyncio.sleep(_RETRY_BACKOFF * (2 ** (attempt - 1)))
+
+            # Feed raw bytes straight to lxml's C parser (no str decode/copy) ####
+            tree = lxml.html.fromstring(content)
+
+            # Types of update: validate each candidate so an unparseable one falls through to the next source ####
             update_date = None
-            
+            bad_candidate = None
+
+            # Look in structured data first (single targeted XPath, no tree walk) ####
+            for blob in tree.xpath('//script[@type="application/ld+json"]/text()'):
+                try:
+                    ld = json.loads(blob)
+                    if isinstance(ld, dict) and 'dateModified' in ld:
+                        candidate = str(ld['dateModified']).strip()
+                        if self.parse_play_store_date(candidate):
+                            update_date = candidate
+                        else:
+                            bad_candidate = candidate
+                        break
+                except:
+                    continue
+
             # Look for "Updated on" text ####
-            updated_elem = soup.find(string=re.compile(r'Updated on|Last updated'))
-            if updated_elem:
-                parent = updated_elem.find_parent()
-                if parent:
-                    next_div = parent.find_next_sibling()
-                    if next_div:
-                        update_date = next_div.get_text(strip=True)
-            
-            # Look in structured data ####
             if not update_date:
-                scripts = soup.find_all('script', type='application/ld+json')
-                for script in scripts:
-                    try:
-                        data = json.loads(script.string)
-                        if isinstance(data, dict) and 'dateModified' in data:
-                            update_date = data['dateModified']
-                            break
-                    except:
-                        continue
-            
-            # Look for date patterns in divs ####
+                siblings = tree.xpath(
+                    '//div[contains(text(), "Updated on") or contains(text(), "Last updated")]'
+                    '/following-sibling::div[1]/text()'
+                )
+                if siblings:
+                    candidate = siblings[0].strip()
+                    if self.parse_play_store_date(candidate):
+                        update_date = candidate
+                    else:
+                        bad_candidate = bad_candidate or candidate
+
+            # Look for date patterns in divs (last resort: collect text nodes in C, regex only those) ####
             if not update_date:
-                date_divs = soup.find_all('div', string=re.compile(r'\w+ \d{1,2}, \d{4}'))
-                if date_divs:
-                    update_date = date_divs[0].get_text(strip=True)
+                for text in tree.xpath('//div/text()'):
+                    if _DIV_DATE_RE.search(text) and self.parse_play_store_date(text):
+                        update_date = text.strip()
+                        break
             
             if update_date:
-                # Clean and validate the date ####
-                parsed_date = self.parse_play_store_date(update_date)
-                if parsed_date:
-                    return update_date, None
-                else:
-                    return None, f"Could not parse date: {update_date}"
+                return update_date, None
+            elif bad_candidate:
+                return None, f"Could not parse date: {bad_candidate}"
             else:
                 return None, "Update date not found on page"
                     
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             return None, "Request timeout"
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             return None, f"Network error: {str(e)}"
         except Exception as e:
             return None, f"Parsing error: {str(e)}"
 
     def add_package(self, package_name: str):
         # Add a new package to track ##############################################################################################################
-        data = self.load_data()
+        data = self.data
         current_time = datetime.now().isoformat()
         
         if package_name in data:
-            print(f"{Fore.BLUE}[*] Info{Fore.RESET} - Package {Fore.BLUE}{package_name}{Fore.RESET} is already being tracked.\n")
+            print(f"{_TAG_INFO} - Package {Fore.BLUE}{package_name}{Fore.RESET} is already being tracked.\n")
             return
 
         print(f"{Fore.YELLOW}[*] Fetching info for {package_name}...{Fore.RESET}")
-        update_date, error = self.get_play_store_update_date(package_name)
-        
+        with self._cache_lock:
+            self._fetch_cache.pop(package_name, None)
+        record = {
+            'check_date': current_time,
+            'last_update': '',
+            'last_fetched': '',
+            'fetch_count': 0,
+            'last_error': '',
+            'etag': '',
+            'last_modified': ''
+        }
+        update_date, error = self.get_play_store_update_date(package_name, record)
+
         if error:
-            print(f"{Fore.RED}[!] Error{Fore.RESET} - Cannot get update date for package {Fore.RED}{package_name}{Fore.RESET}")
+            print(f"{_TAG_ERR} - Cannot get update date for package {Fore.RED}{package_name}{Fore.RESET}")
             print(f"{Fore.RED}    Reason: {error}{Fore.RESET}\n")
             return
 
-        data[package_name] = {
-            'check_date': current_time,
-            'last_update': update_date,
-            'last_fetched': current_time,
-            'fetch_count': 1,
-            'last_error': ''
-        }
-        
-        self.save_data(data)
-        print(f"{Fore.GREEN}[+] Success{Fore.RESET} - Package {Fore.GREEN}{package_name}{Fore.RESET} added successfully!")
-        print(f"{Fore.BLUE}[*] Info{Fore.RESET} - Last update: {Fore.BLUE}{update_date}{Fore.RESET}")
-        print(f"{Fore.BLUE}[*] Info{Fore.RESET} - Started tracking on: {Fore.BLUE}{datetime.now().strftime('%Y-%m-%d %H:%M')}{Fore.RESET}\n")
+        record['last_update'] = update_date
+        record['last_fetched'] = current_time
+        record['fetch_count'] = 1
+        data[package_name] = record
+
+        self.save_package(package_name, record)
+        print(f"{_TAG_OK} - Package {Fore.GREEN}{package_name}{Fore.RESET} added successfully!")
+        print(f"{_TAG_INFO} - Last update: {Fore.BLUE}{update_date}{Fore.RESET}")
+        print(f"{_TAG_INFO} - Started tracking on: {Fore.BLUE}{datetime.now().strftime('%Y-%m-%d %H:%M')}{Fore.RESET}\n")
 
     def delete_package(self, package_name: str):
         # Delete a package from tracking ##########################################################################################################
-        data = self.load_data()
+        data = self.data
         if package_name in data:
             del data[package_name]
-            self.save_data(data)
-            print(f"{Fore.GREEN}[+] Success{Fore.RESET} - Package {Fore.GREEN}{package_name}{Fore.RESET} deleted successfully!\n")
+            with self._cache_lock:
+                self._fetch_cache.pop(package_name, None)
+            try:
+                with self.db:
+                    self.db.execute('DELETE FROM packages WHERE name = ?', (package_name,))
+            except sqlite3.Error as e:
+                print(f"{Fore.RED}[!] Error saving data: {e}{Fore.RESET}")
+            print(f"{_TAG_OK} - Package {Fore.GREEN}{package_name}{Fore.RESET} deleted successfully!\n")
         else:
-            print(f"{Fore.RED}[!] Error{Fore.RESET} - Package {Fore.RED}{package_name}{Fore.RESET} doesn't exist in database\n")
+            print(f"{_TAG_ERR} - Package {Fore.RED}{package_name}{Fore.RESET} doesn't exist in database\n")
 
     def list_packages(self):
         # List all tracked packages ###############################################################################################################
-        data = self.load_data()
+        data = self.data
         if not data:
-            print(f"{Fore.BLUE}[*] Info{Fore.RESET} - No packages are being tracked\n")
+            print(f"{_TAG_INFO} - No packages are being tracked\n")
             return
 
         print(f"{Fore.CYAN}Tracked Packages ({len(data)}):{Fore.RESET}")
         print("-" * 50)
         for package_name, info in data.items():
-            check_date = datetime.fromisoformat(info['check_date']).strftime('%Y-%m-%d %H:%M')
+            check_date = _parse_iso(info['check_date']).strftime('%Y-%m-%d %H:%M')
             print(f"{Fore.WHITE}{package_name}{Fore.RESET}")
             print(f"  Last update: {Fore.BLUE}{info['last_update']}{Fore.RESET}")
             print(f"  Tracking since: {Fore.BLUE}{check_date}{Fore.RESET}")
@@ -230,72 +451,101 @@ class AppUpdateChecker:
                 print(f"  Last error: {Fore.RED}{info['last_error']}{Fore.RESET}")
             print()
 
-    def check_updates(self):
-        # Check updates for all tracked packages ##################################################################################################
-        data = self.load_data()
-        if not data:
-            print(f"{Fore.BLUE}[*] Info{Fore.RESET} - Package database is empty\n")
-            return
+    async def _check_one(self, client: httpx.AsyncClient, package_name: str, info: Dict) -> Tuple[str, Optional[str], Optional[str], bool]:
+        # Fetch the current update date for a single package; the last element says whether the network was hit ###################################
+        # Honor the persisted fetch timestamp: skip the network within cache_duration ####
+        last_fetched = info.get('last_fetched', '')
+        if last_fetched and info.get('last_update') and not info.get('last_error'):
+            try:
+                age = (datetime.now() - _parse_iso(last_fetched)).total_seconds()
+                if 0 <= age < self.cache_duration:
+                    return package_name, info['last_update'], None, False
+            except ValueError:
+                pass
 
-        print(f"{Fore.CYAN}Checking {len(data)} packages for updates...{Fore.RESET}\n")
-        
+        current_update, error = await self._get_update_date(client, package_name, info)
+        return package_name, current_update, error, True
+
+    async def _check_all(self, data: Dict) -> Tuple[int, int]:
+        # Fetches are independent and I/O bound: gather them on one event loop, handle results as they complete ###################################
         updates_found = 0
         errors_found = 0
+        done = 0
 
-        for i, (package_name, info) in enumerate(data.items(), 1):
-            print(f"{Fore.YELLOW}[{i}/{len(data)}] Checking {package_name}...{Fore.RESET}")
-            
-            try:
-                # Get current update date from Play Store ####
-                current_update, error = self.get_play_store_update_date(package_name)
-                
-                # Update fetch statistics ####
-                info['fetch_count'] = info.get('fetch_count', 0) + 1
-                info['last_fetched'] = datetime.now().isoformat()
-                
-                if error:
-                    info['last_error'] = error
-                    errors_found += 1
-                    print(f"{Fore.RED}[!] Error - {package_name}{Fore.RESET} - {error}\n")
-                    continue
-                
-                info['last_error'] = ''
-                old_update = info.get('last_update', '')
-                
-                # Compare dates ####
-                if current_update != old_update and old_update:
-                    # Parse dates ####
-                    old_date = self.parse_play_store_date(old_update)
-                    new_date = self.parse_play_store_date(current_update)
-                    
-                    if new_date and old_date and new_date > old_date:
-                        print(f"{Fore.GREEN}[+] NEW UPDATE!{Fore.RESET} - {Fore.GREEN}{package_name}{Fore.RESET}")
-                        print(f"    Previous: {Fore.BLUE}{old_update}{Fore.RESET}")
-                        print(f"    Current:  {Fore.GREEN}{current_update}{Fore.RESET}")
-                        updates_found += 1
-                        info['last_update'] = current_update
+        # One timestamp for the whole run; bind the hot save to a local (LOAD_FAST in the per-package loop) ####
+        current_time = datetime.now().isoformat()
+        save_package = self.save_package
+
+        async with self._make_client() as client:
+            tasks = [
+                asyncio.create_task(self._check_one(client, package_name, info))
+                for package_name, info in data.items()
+            ]
+            for coro in asyncio.as_completed(tasks):
+                package_name, current_update, error, fetched = await coro
+                info = data[package_name]
+                done += 1
+                print(f"{Fore.YELLOW}[{done}/{len(data)}] Checked {package_name}{Fore.RESET}")
+
+                try:
+                    # Update fetch statistics, but only when the network was actually hit ####
+                    # (otherwise the TTL window would slide on every cached run and never expire) ####
+                    if fetched:
+                        info['fetch_count'] = info.get('fetch_count', 0) + 1
+                        info['last_fetched'] = current_time
+
+                    if error:
+                        info['last_error'] = error
+                        errors_found += 1
+                        print(f"{Fore.RED}[!] Error - {package_name}{Fore.RESET} - {error}\n")
+                        continue
+
+                    info['last_error'] = ''
+                    old_update = info.get('last_update', '')
+
+                    # Compare dates (string equality first, parsing only when they differ) ####
+                    if current_update != old_update and old_update:
+                        if _is_newer_date(current_update, old_update):
+                            print(f"{Fore.GREEN}[+] NEW UPDATE!{Fore.RESET} - {Fore.GREEN}{package_name}{Fore.RESET}")
+                            print(f"    Previous: {Fore.BLUE}{old_update}{Fore.RESET}")
+                            print(f"    Current:  {Fore.GREEN}{current_update}{Fore.RESET}")
+                            updates_found += 1
+                            info['last_update'] = current_update
+                        else:
+                            print(f"{Fore.BLUE}[*] No updates - {package_name}{Fore.RESET}")
+                            print(f"    Last update: {Fore.BLUE}{old_update}{Fore.RESET}")
+                            if current_update != old_update:
+                                info['last_update'] = current_update
                     else:
                         print(f"{Fore.BLUE}[*] No updates - {package_name}{Fore.RESET}")
-                        print(f"    Last update: {Fore.BLUE}{old_update}{Fore.RESET}")
-                        if current_update != old_update:
+                        if current_update:
+                            print(f"    Last update: {Fore.BLUE}{current_update}{Fore.RESET}")
                             info['last_update'] = current_update
-                else:
-                    print(f"{Fore.BLUE}[*] No updates - {package_name}{Fore.RESET}")
-                    if current_update:
-                        print(f"    Last update: {Fore.BLUE}{current_update}{Fore.RESET}")
-                        info['last_update'] = current_update
-
-            except Exception as e:
-                error_msg = f"Unexpected error: {str(e)}"
-                info['last_error'] = error_msg
-                errors_found += 1
-                print(f"{Fore.RED}[!] Error - {package_name}{Fore.RESET} - {error_msg}")
-            
-            print()
-        
-        # Save updated data ####
-        self.save_data(data)
-        
+
+                except Exception as e:
+                    error_msg = f"Unexpected error: {str(e)}"
+                    info['last_error'] = error_msg
+                    errors_found += 1
+                    print(f"{Fore.RED}[!] Error - {package_name}{Fore.RESET} - {error_msg}")
+                finally:
+                    # Persist this package's row right away: O(1), and runs for error results too ####
+                    save_package(package_name, info)
+
+                print()
+
+        return updates_found, errors_found
+
+    def check_updates(self):
+        # Check updates for all tracked packages ##################################################################################################
+        data = self.data
+        if not data:
+            print(f"{_TAG_INFO} - Package database is empty\n")
+            return
+
+        print(f"{Fore.CYAN}Checking {len(data)} packages for updates...{Fore.RESET}\n")
+
+        updates_found, errors_found = asyncio.run(self._check_all(data))
+
         # Summary ####
         print(f"{Fore.CYAN}Check completed!{Fore.RESET}")
         print(f"Updates found: {Fore.GREEN}{updates_found}{Fore.RESET}")